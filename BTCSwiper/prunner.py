@@ -4,6 +4,10 @@ import hashlib
 from ecdsa import SigningKey, SECP256k1
 import base58
 import bech32
+try:
+    import coincurve
+except ImportError:
+    coincurve = None
 
 def random_input_string(conn, length=32):
     c = conn.cursor()
@@ -21,6 +25,8 @@ def derive_private_key(input_string):
 
 def derive_public_key(private_key_hex):
     private_key_bytes = bytes.fromhex(private_key_hex)
+    if coincurve is not None:
+        return coincurve.PublicKey.from_secret(private_key_bytes).format(compressed=True).hex()
     sk = SigningKey.from_string(private_key_bytes, curve=SECP256k1)
     vk = sk.get_verifying_key()
     x = vk.pubkey.point.x()
@@ -45,6 +51,8 @@ def pubkey_to_p2wpkh(pubkey_hex):
 
 def init_db():
     conn = sqlite3.connect("keys.db")
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
     c = conn.cursor()
     c.execute("""
         CREATE TABLE IF NOT EXISTS keys (
@@ -3,18 +3,25 @@
 
 from __future__ import annotations
 import argparse
+import functools
 import importlib
+import itertools
 import logging
 import os
 import shutil
 import subprocess
 import sys
-import tempfile
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Final, Iterable, cast
 
 VERSION: Final[str] = "1.0.2"
 logger = logging.getLogger("m2m")
+_tmp_counter = itertools.count()
+try:
+    _PIL: Any = importlib.import_module("PIL.Image")
+except ModuleNotFoundError:
+    _PIL = None
 MP3_BITRATE: Final[str] = "320k"
 AAC_BITRATE: Final[str] = "256k"
 OPUS_BITRATE: Final[str] = "192k"
@@ -28,32 +35,37 @@ AUDIO_EXTS: Final[set[str]] = {".mp3", ".wav", ".ogg", ".m4a", ".flac", ".aac",
 VIDEO_EXTS: Final[set[str]] = {".mp4", ".mov", ".wmv", ".avi", ".mkv", ".webm", ".flv", ".m4v", ".mpg", ".mpeg", ".3gp", ".ogv"}
 COMMON_MEDIA_EXT: Final[set[str]] = IMAGE_EXTS | ICON_EXTS | VEC_EXTS | AUDIO_EXTS | VIDEO_EXTS
 EXT_TO_CATEGORY: Final[dict[str, str]] = {**{e: "image" for e in IMAGE_EXTS}, **{e: "icon" for e in ICON_EXTS}, **{e: "vector" for e in VEC_EXTS}, **{e: "audio" for e in AUDIO_EXTS}, **{e: "video" for e in VIDEO_EXTS}}
+_AUDIO_OUT: Final[frozenset[str]] = frozenset(e[1:] for e in AUDIO_EXTS)
+_VIDEO_OUT: Final[frozenset[str]] = frozenset(e[1:] for e in VIDEO_EXTS)
+_IMAGE_OUT: Final[frozenset[str]] = frozenset(e[1:] for e in IMAGE_EXTS)
+_IMAGE_OUT_WITH_ICO: Final[frozenset[str]] = _IMAGE_OUT | {"ico"}
+_OUTS_BY_CAT: Final[dict[str, frozenset[str]]] = {"audio": _AUDIO_OUT, "video": _VIDEO_OUT, "vector": _IMAGE_OUT, "image": _IMAGE_OUT_WITH_ICO, "icon": _IMAGE_OUT_WITH_ICO}
+_A_CODECS: Final[dict[str, tuple[str, ...]]] = {"mp3": ("-c:a", "libmp3lame", "-b:a", MP3_BITRATE), "wav": ("-c:a", "pcm_s16le"), "ogg": ("-c:a", "libvorbis", "-q:a", "8"), "opus": ("-c:a", "libopus", "-b:a", OPUS_BITRATE), "flac": ("-c:a", "flac", "-compression_level", "8"), "aac": ("-c:a", "aac", "-b:a", AAC_BITRATE), "m4a": ("-c:a", "aac", "-b:a", AAC_BITRATE), "aiff": ("-c:a", "pcm_s16be"), "wma": ("-c:a", "wmav2", "-b:a", OPUS_BITRATE)}
+_V_CODECS: Final[dict[str, tuple[str, ...]]] = {"mp4": ("-c:v", "libx264", "-crf", VIDEO_CRF, "-preset", VIDEO_PRESET, "-c:a", "aac", "-b:a", AAC_BITRATE, "-movflags", "+faststart"), "mkv": ("-c:v", "libx264", "-crf", VIDEO_CRF, "-preset", VIDEO_PRESET, "-c:a", "aac", "-b:a", AAC_BITRATE), "mov": ("-c:v", "libx264", "-crf", VIDEO_CRF, "-preset", VIDEO_PRESET, "-c:a", "aac", "-b:a", AAC_BITRATE, "-movflags", "+faststart"), "m4v": ("-c:v", "libx264", "-crf", VIDEO_CRF, "-c:a", "aac", "-b:a", AAC_BITRATE, "-movflags", "+faststart"), "webm": ("-c:v", "libvpx-vp9", "-crf", WEBM_CRF, "-b:v", "0", "-c:a", "libopus", "-b:a", OPUS_BITRATE), "avi": ("-c:v", "libx264", "-crf", VIDEO_CRF, "-c:a", "libmp3lame", "-b:a", MP3_BITRATE), "wmv": ("-c:v", "wmv2", "-c:a", "wmav2", "-b:a", OPUS_BITRATE), "flv": ("-c:v", "flv", "-c:a", "libmp3lame", "-b:a", "128k"), "mpg": ("-c:v", "mpeg2video", "-b:v", "5000k", "-c:a", "mp2", "-b:a", "256k"), "mpeg": ("-c:v", "mpeg2video", "-b:v", "5000k", "-c:a", "mp2", "-b:a", "256k"), "3gp": ("-c:v", "h263", "-b:v", "500k", "-c:a", "aac", "-b:a", "64k", "-s", "320x240"), "ogv": ("-c:v", "libtheora", "-q:v", "7", "-c:a", "libvorbis", "-q:a", "5")}
+_THREADED_VCODECS: Final[frozenset[str]] = frozenset({"libx264", "libvpx-vp9"})
+_REMUX_CODECS: Final[dict[str, tuple[str, str]]] = {"mp3": ("", "mp3"), "wav": ("", "pcm_s16le"), "ogg": ("", "vorbis"), "opus": ("", "opus"), "flac": ("", "flac"), "aac": ("", "aac"), "m4a": ("", "aac"), "aiff": ("", "pcm_s16be"), "wma": ("", "wmav2"), "mp4": ("h264", "aac"), "mov": ("h264", "aac"), "m4v": ("h264", "aac"), "mkv": ("*", "*"), "webm": ("vp9", "opus"), "avi": ("h264", "mp3"), "wmv": ("wmv2", "wmav2"), "flv": ("flv1", "mp3"), "mpg": ("mpeg2video", "mp2"), "mpeg": ("mpeg2video", "mp2"), "ogv": ("theora", "vorbis")}
+_FASTSTART_EXTS: Final[frozenset[str]] = frozenset({"mp4", "mov", "m4v"})
 
-def outs_for(input_ext_dot: str) -> set[str]:
-    cat = EXT_TO_CATEGORY.get(input_ext_dot)
-    if cat is None:
-        return set()
-    if cat == "audio":
-        return {e.lstrip(".") for e in AUDIO_EXTS}
-    if cat == "video":
-        return {e.lstrip(".") for e in VIDEO_EXTS}
-    if cat == "vector":
-        return {e.lstrip(".") for e in IMAGE_EXTS}
-    if cat == "image":
-        return {e.lstrip(".") for e in IMAGE_EXTS} | {"ico"}
-    if cat == "icon":
-        return {e.lstrip(".") for e in IMAGE_EXTS} | {"ico"}
-    return set()
-
-def a_codec(out_ext: str) -> list[str]:
-    return {"mp3": ["-c:a", "libmp3lame", "-b:a", MP3_BITRATE], "wav": ["-c:a", "pcm_s16le"], "ogg": ["-c:a", "libvorbis", "-q:a", "8"], "opus": ["-c:a", "libopus", "-b:a", OPUS_BITRATE], "flac": ["-c:a", "flac", "-compression_level", "8"], "aac": ["-c:a", "aac", "-b:a", AAC_BITRATE], "m4a": ["-c:a", "aac", "-b:a", AAC_BITRATE], "aiff": ["-c:a", "pcm_s16be"], "wma": ["-c:a", "wmav2", "-b:a", OPUS_BITRATE]}.get(out_ext, [])
-
-def v_codec(out_ext: str) -> list[str]:
-    return {"mp4": ["-c:v", "libx264", "-crf", VIDEO_CRF, "-preset", VIDEO_PRESET, "-c:a", "aac", "-b:a", AAC_BITRATE, "-movflags", "+faststart"], "mkv": ["-c:v", "libx264", "-crf", VIDEO_CRF, "-preset", VIDEO_PRESET, "-c:a", "aac", "-b:a", AAC_BITRATE], "mov": ["-c:v", "libx264", "-crf", VIDEO_CRF, "-preset", VIDEO_PRESET, "-c:a", "aac", "-b:a", AAC_BITRATE], "m4v": ["-c:v", "libx264", "-crf", VIDEO_CRF, "-c:a", "aac", "-b:a", AAC_BITRATE], "webm": ["-c:v", "libvpx-vp9", "-crf", WEBM_CRF, "-b:v", "0", "-c:a", "libopus", "-b:a", OPUS_BITRATE], "avi": ["-c:v", "libx264", "-crf", VIDEO_CRF, "-c:a", "libmp3lame", "-b:a", MP3_BITRATE], "wmv": ["-c:v", "wmv2", "-c:a", "wmav2", "-b:a", OPUS_BITRATE], "flv": ["-c:v", "flv", "-c:a", "libmp3lame", "-b:a", "128k"], "mpg": ["-c:v", "mpeg2video", "-b:v", "5000k", "-c:a", "mp2", "-b:a", "256k"], "mpeg": ["-c:v", "mpeg2video", "-b:v", "5000k", "-c:a", "mp2", "-b:a", "256k"], "3gp": ["-c:v", "h263", "-b:v", "500k", "-c:a", "aac", "-b:a", "64k", "-s", "320x240"], "ogv": ["-c:v", "libtheora", "-q:v", "7", "-c:a", "libvorbis", "-q:a", "5"]}.get(out_ext, [])
+@functools.cache
+def outs_for(input_ext_dot: str) -> frozenset[str]:
+    return _OUTS_BY_CAT.get(EXT_TO_CATEGORY.get(input_ext_dot, ""), frozenset())
+
+def a_codec(out_ext: str, threads: int = 0) -> list[str]:
+    args = list(_A_CODECS.get(out_ext, ()))
+    return args + ["-threads", str(threads)] if args and threads else args
+
+def v_codec(out_ext: str, per_file_threads: int = 0) -> list[str]:
+    args = list(_V_CODECS.get(out_ext, ()))
+    if not args or (not per_file_threads and args[1] not in _THREADED_VCODECS):
+        return args
+    return args[:2] + ["-threads", str(per_file_threads)] + args[2:]
 
 class ConversionError(RuntimeError):
     pass
 
+class ConversionTimeout(ConversionError):
+    pass
+
 def _norm_ext(value: str) -> str:
     value = value.strip().lower()
     if not value:
@@ -65,17 +77,29 @@ def _norm_ext(value: str) -> str:
         raise argparse.ArgumentTypeError(f"invalid extension: {value!r}")
     return value
 
-def need_ffmpeg() -> None:
-    if not shutil.which("ffmpeg"):
+@functools.lru_cache(maxsize=1)
+def _ffmpeg_path() -> str | None:
+    return shutil.which("ffmpeg")
+
+@functools.lru_cache(maxsize=1)
+def _ffprobe_path() -> str | None:
+    return shutil.which("ffprobe")
+
+def need_ffmpeg() -> str:
+    ffmpeg = _ffmpeg_path()
+    if not ffmpeg:
         raise ConversionError("Missing dependency: ffmpeg (https://ffmpeg.org/download.html)")
+    return ffmpeg
 
 def run_ff(cmd: list[str], timeout: int) -> None:
+    debug = logger.isEnabledFor(logging.DEBUG)
     try:
-        p = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=timeout)
+        p = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE if debug else subprocess.DEVNULL, timeout=timeout)
     except subprocess.TimeoutExpired as e:
-        raise ConversionError(f"ffmpeg timed out after {timeout}s") from e
+        raise ConversionTimeout(f"ffmpeg timed out after {timeout}s") from e
     if p.returncode != 0:
-        raise ConversionError(p.stderr.strip() or f"ffmpeg exited with code {p.returncode}")
+        err = p.stderr.decode(errors="replace").strip() if debug else ""
+        raise ConversionError(err or f"ffmpeg exited with code {p.returncode} (use --verbose for details)")
 
 def iter_in(src: str, in_ext: str) -> Iterable[str]:
     if os.path.isfile(src):
@@ -84,41 +108,45 @@ def iter_in(src: str, in_ext: str) -> Iterable[str]:
     if not os.path.isdir(src):
         raise ConversionError(f"Source is not a file or directory: {src}")
     want = None if in_ext == "any" else f".{in_ext}"
-    for name in sorted(os.listdir(src)):
-        path = os.path.join(src, name)
-        if os.path.isdir(path) or os.path.islink(path):
+    with os.scandir(src) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    for entry in entries:
+        if not entry.is_file(follow_symlinks=False):
             continue
-        _, ext = os.path.splitext(path)
-        ext = ext.lower()
+        ext = os.path.splitext(entry.name)[1].lower()
         if want is not None and ext != want:
             continue
         if want is None and ext not in COMMON_MEDIA_EXT:
             continue
-        yield path
+        yield entry.path
 
 def tmp_path(dest_dir: str, out_ext: str) -> str:
-    fd, path = tempfile.mkstemp(prefix=".m2m_", suffix=f".{out_ext}", dir=dest_dir)
-    os.close(fd)
-    return path
+    while True:
+        path = os.path.join(dest_dir, f".m2m_{os.getpid()}_{next(_tmp_counter)}.{out_ext}")
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+        except FileExistsError:
+            continue
+        os.close(fd)
+        return path
 
 def keep_times(src_path: str, out_path: str) -> None:
     try:
         st = os.stat(src_path)
-        os.utime(out_path, (st.st_atime, st.st_mtime))
+        os.utime(out_path, ns=(st.st_atime_ns, st.st_mtime_ns))
     except OSError:
         return
 
 def to_ico(src_path: str, tmp_out: str) -> None:
-    try:
-        Image = cast(Any, importlib.import_module("PIL.Image"))
-    except ModuleNotFoundError as e:
-        raise ConversionError("Output .ico requires Pillow (pip install pillow)") from e
+    if _PIL is None:
+        raise ConversionError("Output .ico requires Pillow (pip install pillow)")
+    Image = _PIL
     ICON_SIZES: Final[tuple[tuple[int, int], ...]] = ((16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256))
     with Image.open(src_path) as img:
-        img_rgba = img.convert("RGBA")
+        img_rgba = img if img.mode == "RGBA" else img.convert("RGBA")
         w, h = img_rgba.size
-        side = max(w, h)
         if w != h:
+            side = max(w, h)
             canvas = Image.new("RGBA", (side, side), (0, 0, 0, 0))
             canvas.paste(img_rgba, ((side - w) // 2, (side - h) // 2))
             img_rgba = canvas
@@ -135,19 +163,70 @@ def vec_to_ras(tmp_out: str, src_path: str, out_ext: str) -> None:
         raise ConversionError("Failed to parse vector file")
     renderPM.drawToFile(drawing, tmp_out, fmt=out_ext.upper())
 
+@functools.cache
+def _pil_save_format(out_ext: str) -> str | None:
+    if _PIL is None:
+        return None
+    fmt = _PIL.registered_extensions().get(f".{out_ext}")
+    return fmt if fmt in _PIL.SAVE else None
+
+def _pil_save(img: Any, tmp_out: str, fmt: str) -> None:
+    if fmt == "JPEG" and img.mode not in ("RGB", "L", "CMYK"):
+        img = img.convert("RGB")
+    img.save(tmp_out, format=fmt)
+
 def ras_pil(src_path: str, tmp_out: str, out_ext: str) -> bool:
-    try:
-        Image = cast(Any, importlib.import_module("PIL.Image"))
-    except ModuleNotFoundError:
+    fmt = _pil_save_format(out_ext)
+    if fmt is None:
         return False
     try:
-        with Image.open(src_path) as img:
-            img.save(tmp_out, format=out_ext.upper())
+        with _PIL.open(src_path) as img:
+            _pil_save(img, tmp_out, fmt)
         return True
     except Exception:
         return False
 
-def convert(src_path: str, out_ext: str, dest_dir: str, overwrite: bool, timeout: int) -> str:
+def _discard(path: str) -> None:
+    try:
+        if os.path.exists(path):
+            os.remove(path)
+    except OSError:
+        pass
+
+def _probe_codec(path: str, timeout: int) -> tuple[str | None, str | None]:
+    ffprobe = _ffprobe_path()
+    if not ffprobe:
+        return None, None
+    try:
+        p = subprocess.run([ffprobe, "-v", "error", "-show_entries", "stream=codec_type,codec_name", "-of", "compact=p=0", path], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=timeout)
+    except (OSError, subprocess.TimeoutExpired):
+        return None, None
+    if p.returncode != 0:
+        return None, None
+    first: dict[str, str] = {}
+    for line in p.stdout.splitlines():
+        fields = dict(f.split("=", 1) for f in line.split("|") if "=" in f)
+        kind, name = fields.get("codec_type"), fields.get("codec_name")
+        if kind and name:
+            first.setdefault(kind, name)
+    return first.get("video"), first.get("audio")
+
+def remux_args(src_path: str, src_cat: str | None, out_ext: str, timeout: int) -> list[str] | None:
+    want = _REMUX_CODECS.get(out_ext)
+    if want is None or src_cat not in ("audio", "video"):
+        return None
+    want_v, want_a = want
+    v, a = _probe_codec(src_path, timeout)
+    if src_cat == "audio":
+        return ["-c:a", "copy"] if a is not None and want_a in ("*", a) else None
+    if v is None or want_v not in ("*", v) or (a is not None and want_a not in ("*", a)):
+        return None
+    args = ["-c:v", "copy", "-c:a", "copy"]
+    if out_ext in _FASTSTART_EXTS:
+        args += ["-movflags", "+faststart"]
+    return args
+
+def convert(src_path: str, out_ext: str, dest_dir: str, overwrite: bool, timeout: int, threads: int = 0, remux: bool = True) -> str:
     base = os.path.basename(src_path)
     stem, _ = os.path.splitext(base)
     out_path = os.path.join(dest_dir, f"{stem}.{out_ext}")
@@ -165,34 +244,50 @@ def convert(src_path: str, out_ext: str, dest_dir: str, overwrite: bool, timeout
     try:
         if out_ext == "ico":
             to_ico(src_path, tmp_out)
-        elif src_ext in VEC_EXTS and out_ext in {e.lstrip('.') for e in IMAGE_EXTS}:
+        elif src_ext in VEC_EXTS and out_ext in _IMAGE_OUT:
             vec_to_ras(tmp_out, src_path, out_ext)
         elif src_ext in IMAGE_EXTS or src_ext == ".ico":
             if not ras_pil(src_path, tmp_out, out_ext):
-                need_ffmpeg()
-                cmd = ["ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "error" if not logger.isEnabledFor(logging.DEBUG) else "warning", "-i", src_path, "-y", tmp_out]
+                ffmpeg = need_ffmpeg()
+                cmd = [ffmpeg, "-nostdin", "-hide_banner", "-nostats", "-loglevel", "error" if not logger.isEnabledFor(logging.DEBUG) else "warning", "-i", src_path, "-y", tmp_out]
                 run_ff(cmd, timeout)
         else:
-            need_ffmpeg()
+            ffmpeg = need_ffmpeg()
             src_cat = EXT_TO_CATEGORY.get(src_ext)
-            cmd = ["ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "error" if not logger.isEnabledFor(logging.DEBUG) else "warning", "-i", src_path, "-y"]
+            copy = remux_args(src_path, src_cat, out_ext, timeout) if remux else None
+            if copy is not None:
+                logger.debug("%s: codecs match .%s, remuxing without re-encode", os.path.basename(src_path), out_ext)
+            cmd = [ffmpeg, "-nostdin", "-hide_banner", "-nostats", "-loglevel", "error" if not logger.isEnabledFor(logging.DEBUG) else "warning", "-i", src_path, "-y"]
+            encode: list[str] = []
             if src_cat == "audio":
                 cmd += ["-map", "0:a:0?", "-vn", "-sn", "-dn", "-map_metadata", "0"]
-                cmd += a_codec(out_ext)
+                encode = a_codec(out_ext, threads)
             elif src_cat == "video":
                 cmd += ["-map", "0:v:0?", "-map", "0:a:0?", "-sn", "-dn", "-map_metadata", "0"]
-                cmd += v_codec(out_ext)
-            cmd.append(tmp_out)
-            run_ff(cmd, timeout)
+                encode = v_codec(out_ext, threads)
+            remuxed = False
+            if copy is not None:
+                try:
+                    run_ff(cmd + copy + [tmp_out], timeout)
+                    remuxed = True
+                except ConversionTimeout:
+                    raise
+                except ConversionError as e:
+                    logger.debug("%s: remux failed (%s); re-encoding", os.path.basename(src_path), e)
+            if not remuxed:
+                run_ff(cmd + encode + [tmp_out], timeout)
         os.replace(tmp_out, out_path)
         keep_times(src_path, out_path)
         return "ok"
     finally:
-        try:
-            if os.path.exists(tmp_out):
-                os.remove(tmp_out)
-        except OSError:
-            pass
+        _discard(tmp_out)
+
+def _report(ok: int, fail: int, skip: int) -> int:
+    if skip:
+        logger.info("Done: %d ok, %d failed, %d skipped", ok, fail, skip)
+    else:
+        logger.info("Done: %d ok, %d failed", ok, fail)
+    return 0 if fail == 0 else 1
 
 def main(argv: list[str] | None = None) -> int:
     argv = sys.argv[1:] if argv is None else argv
@@ -208,7 +303,9 @@ def main(argv: list[str] | None = None) -> int:
     p.add_argument("--dir", "-d", dest="src", help="Alias for --src (directory)")
     p.add_argument("--res", "-r", dest="dest", help="Alias for --dest")
     p.add_argument("--overwrite", action="store_true", help="Overwrite existing outputs")
+    p.add_argument("--no-remux", action="store_true", help="Always re-encode, even when source codecs already fit the output container")
     p.add_argument("--timeout", type=int, default=900, help="ffmpeg timeout in seconds (default: 900)")
+    p.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, help="Parallel conversions (default: CPU count)")
     p.add_argument("--verbose", "-v", action="store_true", help="Verbose logging")
     args = p.parse_args(argv)
     if args.version:
@@ -222,6 +319,8 @@ def main(argv: list[str] | None = None) -> int:
     in_ext = args.input
     if args.timeout <= 0:
         raise SystemExit("--timeout must be positive")
+    if args.jobs <= 0:
+        raise SystemExit("--jobs must be positive")
     default_dest = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
     dest = os.path.abspath(os.path.expanduser(args.dest)) if args.dest else default_dest
     os.makedirs(dest, exist_ok=True)
@@ -229,25 +328,63 @@ def main(argv: list[str] | None = None) -> int:
     if not files:
         logger.info("No matching files found.")
         return 0
-    ok = fail = skip = 0
-    logger.info("Converting %d file(s) -> .%s", len(files), out_ext)
+    good: list[str] = []
+    bad: dict[str, list[str]] = {}
     for path in files:
+        ext = os.path.splitext(path)[1].lower()
+        if out_ext in outs_for(ext):
+            good.append(path)
+        else:
+            bad.setdefault(ext, []).append(path)
+    for ext, paths in sorted(bad.items()):
+        allowed = outs_for(ext)
+        msg = f".{out_ext} is not valid for input {ext}. Allowed: {', '.join(sorted(allowed))}" if allowed else f"Unsupported input extension: {ext}"
+        if len(paths) == 1:
+            logger.error("%s: %s", os.path.basename(paths[0]), msg)
+            continue
+        logger.error("%d file(s) cannot be converted: %s", len(paths), msg)
+        for path in paths:
+            logger.debug("  %s", os.path.basename(path))
+    files = good
+    ok = skip = 0
+    fail = sum(len(paths) for paths in bad.values())
+    if not files:
+        return _report(ok, fail, skip)
+    chosen: dict[str, str] = {}
+    for path in files:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        prev = chosen.get(stem)
+        if prev is not None:
+            dropped, kept = (prev, path) if args.overwrite else (path, prev)
+            logger.warning("%s: %s.%s is also produced by %s; skipping", os.path.basename(dropped), stem, out_ext, os.path.basename(kept))
+            skip += 1
+            if not args.overwrite:
+                continue
+        chosen[stem] = path
+    files = list(chosen.values())
+    logger.info("Converting %d file(s) -> .%s", len(files), out_ext)
+    jobs = min(args.jobs, len(files))
+    threads = 1 if jobs > 1 else 0
+    with ThreadPoolExecutor(max_workers=jobs) as ex:
+        futures = {ex.submit(convert, path, out_ext, dest, args.overwrite, args.timeout, threads, not args.no_remux): path for path in files}
         try:
-            status = convert(path, out_ext, dest, args.overwrite, args.timeout)
-            if status == "ok":
-                ok += 1
-            else:
-                skip += 1
-        except Exception as e:
-            fail += 1
-            logger.error("%s: %s", os.path.basename(path), e)
-            if logger.isEnabledFor(logging.DEBUG):
-                traceback.print_exc()
-    if skip:
-        logger.info("Done: %d ok, %d failed, %d skipped", ok, fail, skip)
-    else:
-        logger.info("Done: %d ok, %d failed", ok, fail)
-    return 0 if fail == 0 else 1
+            for fut in as_completed(futures):
+                path = futures[fut]
+                try:
+                    status = fut.result()
+                    if status == "ok":
+                        ok += 1
+                    else:
+                        skip += 1
+                except Exception as e:
+                    fail += 1
+                    logger.error("%s: %s", os.path.basename(path), e)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        traceback.print_exception(type(e), e, e.__traceback__)
+        except KeyboardInterrupt:
+            ex.shutdown(wait=False, cancel_futures=True)
+            raise
+    return _report(ok, fail, skip)
 
 if __name__ == "__main__":
     raise SystemExit(main())